@@ -1,4 +1,4 @@
-from typing import Any, Optional, Sequence
+from typing import Any, Optional, Sequence, Union
 
 import pytest as pytest
 
@@ -189,3 +189,17 @@ def test_with_generic_typehint():
 
     assert SomeSettings.grab().generic_settings_field == ['a', '1', '!']
     assert type(SomeSettings.grab().generic_settings_field) is list
+
+
+def test_union_typehint_keeps_its_arg_order():
+    # (Using flat unions, `typing` its self reuses an equal `Optional[Union[...]]`,
+    #  regardless of the arg order)
+    class SettingsA(BaseSettings):
+        a: Union[int, str, None]
+
+    class SettingsB(BaseSettings):
+        b: Union[str, int, None]
+
+    assert SettingsA._setting_fields['a'].type_hint.__args__ == (int, str)
+    assert SettingsB._setting_fields['b'].type_hint.__args__ == (str, int)
+    assert not SettingsA._setting_fields['a'].required
@@ -6,10 +6,12 @@ import datetime as dt
 from typing import Any, Optional
 
 import pytest
+from xbool import bool_value
 from xsentinels import Default
 
+from xsettings.default_converters import DEFAULT_CONVERTERS, to_bool, to_date
 from xsettings.env_settings import EnvVarSettings
-from xsettings.fields import SettingsConversionError, _PropertyRetriever
+from xsettings.fields import SettingsClassProperty, SettingsConversionError, _PropertyRetriever
 from xsettings.settings import BaseSettings, SettingsField
 from xsettings.errors import SettingsValueError
 from xsettings.retreivers import SettingsRetrieverProtocol
@@ -103,6 +105,67 @@ def test_default_converters():
     assert my_settings.my_custom_converter == Decimal(1.654)
 
 
+def test_to_bool_matches_xbool():
+    # `to_bool` has its own copy of the true-strings, make sure it agrees with `xbool`.
+    tokens = ['y', 'yes', 't', 'true', 'on', '1', 'n', 'no', 'f', 'false', 'off', '0', '', 'other']
+    for token in tokens:
+        for value in (token, token.upper(), token.title(), f"  {token}\n"):
+            assert to_bool(value) is bool_value(value), value
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2023-01-05", dt.date(2023, 1, 5)),
+        ("2023-1-5", dt.date(2023, 1, 5)),
+        ("2023-12-31", dt.date(2023, 12, 31)),
+        ("20230105", None),
+        ("2023-W01-1", None),
+        ("2023-02-30", None),
+    ],
+)
+def test_to_date_formats(value, expected):
+    if expected is None:
+        with pytest.raises(ValueError):
+            to_date(value)
+    else:
+        assert to_date(value) == expected
+
+
+def test_changing_field_converter_and_type_hint_after_class_created():
+    class MySettings(BaseSettings):
+        my_field: int = "5"
+
+    my_settings = MySettings()
+    field = MySettings._setting_fields['my_field']
+    assert my_settings.my_field == 5
+
+    field.converter = lambda x: int(x) * 100
+    assert my_settings.my_field == 500
+
+    field.converter = None
+    field.type_hint = Decimal
+    assert my_settings.my_field == Decimal("5")
+
+
+def test_default_converter_registered_after_class_created():
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    class MySettings(BaseSettings):
+        my_point: Point = "1,2"
+
+    DEFAULT_CONVERTERS[Point] = lambda v: Point(*(int(p) for p in v.split(',')))
+    try:
+        my_point = MySettings().my_point
+    finally:
+        del DEFAULT_CONVERTERS[Point]
+
+    assert (my_point.x, my_point.y) == (1, 2)
+
+
 def test_defaults():
     class MySettings(BaseSettings):
         no_default: int
@@ -223,6 +286,30 @@ def test_class_field_overwrite():
     with pytest.raises(AttributeError):
         MySettings.b = 3
 
+    # Class-level lookup of an unknown attribute still gives back a lazy forward-ref.
+    assert isinstance(MySettings.b, SettingsClassProperty)
+
+
+def test_class_forward_ref_reused_per_class():
+    class MySettings(BaseSettings):
+        a: str = 'parent-a'
+
+    class MySubSettings(MySettings):
+        pass
+
+    assert MySettings.a is MySettings.a
+
+    # Each class has its own forward-ref, as it needs to look up value from its own class.
+    assert MySubSettings.a is not MySettings.a
+
+    class SomeClass:
+        parent_a = MySettings.a
+        sub_a = MySubSettings.a
+
+    MySubSettings.grab().a = 'sub-a'
+    assert SomeClass.parent_a == 'parent-a'
+    assert SomeClass.sub_a == 'sub-a'
+
 
 def test_settings_inheritance():
     class MySettings(BaseSettings):
@@ -243,6 +330,27 @@ def test_settings_inheritance():
     assert MySubSettings.grab().a == 4
 
 
+def test_settings_multiple_inheritance_uses_mro_for_fields():
+    class MySettings(BaseSettings):
+        a: int = 1
+
+    class MyFirstSubSettings(MySettings):
+        b: int = 2
+
+    class MySecondSubSettings(MySettings):
+        a: int = 3
+
+    class MyCombinedSettings(MyFirstSubSettings, MySecondSubSettings):
+        c: int = 4
+
+    # `MySecondSubSettings` comes before `MySettings` in the `__mro__`, so its field wins.
+    assert MyCombinedSettings.grab().a == 3
+    assert MyCombinedSettings.grab().b == 2
+    assert MyCombinedSettings.grab().c == 4
+    assert MyFirstSubSettings.grab().a == 1
+    assert set(MyCombinedSettings._all_setting_fields) == {'a', 'b', 'c'}
+
+
 def test_property_as_forward_ref_works_via_return_type():
     did_call_property = False
 
@@ -556,6 +664,48 @@ def test_inherit_multiple_retrievers():
         error_getting_non_optional_value = my_parent_settings.c
 
 
+def test_field_cache_remembers_retrieved_value():
+    retrieved = []
+
+    def retriever(*, field: SettingsField, settings: BaseSettings):
+        retrieved.append(field.name)
+        return str(len(retrieved))
+
+    class MySettings(BaseSettings, default_retrievers=retriever):
+        cached: int = SettingsField(cache=True)
+        not_cached: int
+
+    my_settings = MySettings()
+
+    # Only retrieved the first time for the cached field, converted value is remembered.
+    assert my_settings.cached == 1
+    assert my_settings.cached == 1
+    assert retrieved == ['cached']
+
+    # Non-cached field is retrieved each time.
+    assert my_settings.not_cached == 2
+    assert my_settings.not_cached == 3
+
+    # Value set directly on instance is still used over remembered value.
+    my_settings.cached = 10
+    assert my_settings.cached == 10
+
+    # Copies don't get the remembered values.
+    del my_settings.cached
+    assert copy(my_settings).cached == 4
+    assert my_settings.cached == 1
+
+    # Class-level default changes don't change a remembered value, until it's forgotten.
+    MySettings.cached = 20
+    assert my_settings.cached == 1
+    my_settings.settings__forget_cached_values('not_cached')
+    assert my_settings.cached == 1
+    my_settings.settings__forget_cached_values('cached')
+    assert my_settings.cached == 5
+    my_settings.settings__forget_cached_values()
+    assert my_settings.cached == 6
+
+
 def test_grab_setting_values_from_parent_dependency_instances():
     def r1(*, field: SettingsField, settings: BaseSettings):
         return 2 if field.name == 'c' else 'str-val'
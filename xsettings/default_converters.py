@@ -1,29 +1,56 @@
 from decimal import Decimal
 from typing import Callable, Dict, Any, Type
 import datetime as dt
-from dateutil import tz
-import ciso8601
 from xbool import bool_value
 
 
+_TRUE_STRINGS = frozenset(('y', 'yes', 't', 'true', 'on', '1'))
+"""
+Strings (stripped + lower-cased) that `xbool.bool_value` considers `True`.
+
+Mirrors the true-strings of xbool 1.1.0 (its `_strtobool`); if that list changes in xbool,
+this needs to be updated to match.
+"""
+
+
 def to_bool(value):
+    # Should pretty much always be a string, so check for that first;
+    # same result as `bool_value`, any other string is `False`.
+    if type(value) is str:
+        return value.strip().lower() in _TRUE_STRINGS
+
     return bool_value(value)
 
 
 def to_date(value):
-    return dt.datetime.strptime(str(value), '%Y-%m-%d').date()
+    if type(value) is not str:
+        value = str(value)
+
+    # `date.fromisoformat` parses `YYYY-MM-DD` in C, much faster than `strptime`;
+    # but depending on the python version it accepts other formats too, so only use it for that.
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        try:
+            return dt.date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    return dt.datetime.strptime(value, '%Y-%m-%d').date()
 
 
 def to_datetime(value):
     # Should pretty much always be a string, so check for that first.
     if isinstance(value, str):
+        # Imported lazily, only needed when a datetime field is actually converted
+        # (after the first time, python finds it in `sys.modules`).
+        import ciso8601
         return ciso8601.parse_datetime(value)
 
     if isinstance(value, dt.datetime):
         return value
 
     if isinstance(value, dt.date):
-        return dt.datetime(value.year, value.month, value.day, tzinfo=tz.tzutc())
+        from dateutil import tz
+        return dt.datetime(value.year, value.month, value.day, tzinfo=tz.UTC)
 
     raise ValueError(
         f"Tried to convert a datetime from unsupported BaseSettings value ({value})."
@@ -31,6 +58,10 @@ def to_datetime(value):
 
 
 def to_decimal(value):
+    # Should pretty much always be a string, so check for that first.
+    if type(value) is str:
+        return Decimal(value)
+
     if isinstance(value, float):
         # If we don't convert to string first, we could end up with an
         # undesirable binaryFloat --> Decimal conversion.
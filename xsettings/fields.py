@@ -1,4 +1,5 @@
 import dataclasses
+import sys
 from typing import Callable, Iterable
 from copy import copy
 from typing import Type, Any, Dict, Generic, TypeVar, TYPE_CHECKING, get_type_hints
@@ -15,6 +16,12 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Dataclasses can only generate `__slots__` for us on Python 3.10+.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+_IMMUTABLE_DEFAULT_TYPES = frozenset((int, float, complex, str, bytes, bool, tuple, frozenset))
+""" Default values of these exact types are immutable, `SettingsField.merge` won't copy them. """
+
 
 # It's both an attribute and a value error
 # (attribute is missing and/or value has some other issue)
@@ -46,16 +53,26 @@ class _PropertyRetriever:
     object/type the property is getting a value for; just like any other
     normal property would have happened when the value is asked for.
     """
+    __slots__ = ('property_retriever', '_fget')
+
     property_retriever: property
 
     def __init__(self, property_retriever: property):
         self.property_retriever = property_retriever
 
+        # For plain properties we can call the getter function directly,
+        # and skip going though `property.__get__` each time the value is retrieved.
+        # Subclasses of property may customize `__get__`, so we keep using it for them.
+        self._fget = property_retriever.fget if type(property_retriever) is property else None
+
     def __call__(self, *, field: 'SettingsField', settings: 'BaseSettings') -> Any:
+        fget = self._fget
+        if fget is not None:
+            return fget(settings)
         return self.property_retriever.__get__(settings, type(settings))
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_DATACLASS_SLOTS)
 class SettingsField:
     name: str = None
     """ Defaults to the attribute name, but you can override this to provide an alternate name
@@ -169,6 +186,42 @@ class SettingsField:
     use that for the default-value when needed.
     """
 
+    cache: bool = None
+    """
+    If `True`, once a value has been retrieved for this field via the retrievers
+    and/or default-value, it's remembered on that settings instance and returned on future
+    reads of the field without consulting the retrievers/default-value again.
+
+    Useful when retrieving the value is expensive (ie: retriever looks up value from a remote
+    service) and the value won't change for the life of the settings instance.
+
+    Values set directly on the settings instance are always used over a remembered value.
+    A copy of the settings instance won't have any of the remembered values.
+
+    A remembered value is kept for the life of the settings instance, even if the field's
+    default value is changed on the class later on; use
+    `xsettings.settings.BaseSettings.settings__forget_cached_values` to forget it.
+
+    Defaults to `None`, which is the same as `False` (value is retrieved on every read).
+
+    >>> class MySettings(BaseSettings, default_retrievers=MyRemoteRetriever()):
+    ...     my_field: str = SettingsField(cache=True)
+    """
+
+    # Fallback converter and base type-hint for `type_hint`, found by
+    # `SettingsField._resolve_converter` so we don't inspect the typing objects on every
+    # conversion. They are found again if `type_hint` is changed (see `_resolved_type_hint`).
+    # (for a `None` type-hint, they are all `None`; so their defaults are already resolved)
+    _fallback_converter: Callable = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _base_type_hint: Type = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _resolved_type_hint: Any = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def getter(self):
         """
@@ -247,10 +300,15 @@ class SettingsField:
             self.type_hint = override.type_hint
         if override.retriever:
             self.retriever = override.retriever
+        if override.cache is not None:
+            self.cache = override.cache
 
-        if override.default_value is not None:
+        default_value = override.default_value
+        if default_value is not None:
             # Copy default value in case it's a mutable object, like a dict.
-            self.default_value = copy(override.default_value)
+            if type(default_value) not in _IMMUTABLE_DEFAULT_TYPES:
+                default_value = copy(default_value)
+            self.default_value = default_value
         return self
 
     def retrieve_value(self, *, settings: 'BaseSettings'):
@@ -280,13 +338,21 @@ class SettingsField:
 
         Returns: Converted Value
         """
+        if value is None:
+            # Nothing to convert (and nothing to complain about if required).
+            return None
+
         original_value = value
 
+        type_hint = self.type_hint
+        if type_hint is not self._resolved_type_hint:
+            self._resolve_converter()
+
         # Check for a user-provided converter....
         converter = self.converter
 
         if not converter:
-            converter = DEFAULT_CONVERTERS.get(self.type_hint, None)
+            converter = DEFAULT_CONVERTERS.get(type_hint, None)
 
             # If the value is still `Default`, we 'default' the value to `None`,
             # as our default converters or using the type-hint directly don't really
@@ -298,11 +364,12 @@ class SettingsField:
                 value = None
 
         if not converter:
-            converter = self._get_default_converter()
+            converter = self._fallback_converter
 
         if converter and value is not None:
-            hint = self._get_base_typehint()
-            if not hint or not isinstance(value, hint):
+            hint = self._base_type_hint
+            # Exact-type check first, it's the common case and cheaper than `isinstance`.
+            if not hint or (type(value) is not hint and not isinstance(value, hint)):
                 try:
                     value = converter(value)
                 except Exception as e:
@@ -324,6 +391,22 @@ class SettingsField:
             )
         return value
 
+    def _resolve_converter(self):
+        """
+        Finds the converter `SettingsField.convert_value` falls back to when there is no
+        `SettingsField.converter` and nothing for the type-hint in
+        `xsettings.default_converters.DEFAULT_CONVERTERS` (ie: `int(value)` or `str(value)`),
+        along with the base type-hint used to check if a value needs converting
+        (ie: `list` for `List[str]`), for the current `SettingsField.type_hint`.
+
+        Called when field is finalized at BaseSettings subclass creation time,
+        and by `SettingsField.convert_value` if `type_hint` was changed since then.
+        """
+        type_hint = self.type_hint
+        self._fallback_converter = self._get_default_converter()
+        self._base_type_hint = self._get_base_typehint()
+        self._resolved_type_hint = type_hint
+
     def _get_default_converter(self) -> Callable:
         hint = self.type_hint
         if isinstance(hint, typing_inspect.typingGenericAlias):
@@ -355,18 +438,15 @@ class SettingsField:
 
 
 def _allowed_field(k: str, v):
-    # For private attributes, don't make fields.
-    if k.startswith("_"):
+    # For private attributes, don't make fields (dunder attributes also start with `_`).
+    if k[:1] == "_":
         return False
 
     # These should be normal properties, defined directly on the class.
     # if isinstance(v, property):
     #     return False
 
-    if isinstance(v, staticmethod):
-        return False
-
-    if isinstance(v, classmethod):
+    if isinstance(v, (staticmethod, classmethod)):
         return False
 
     # For normal methods/callables, don't generate a field.
@@ -406,37 +486,38 @@ def generate_setting_fields(
     allowed_field_names = set(fields.keys())
     if annotations:
         for key in annotations.keys():
-            if not key.startswith("_") and key not in attrs:
+            if key[:1] != "_" and key not in attrs:
                 allowed_field_names.add(key)
 
+    if not allowed_field_names:
+        # Nothing on this class can become a field (ie: subclass only adds methods/private attrs
+        # or nothing at all); inherited fields stay on the parent classes.
+        return {}
+
     setting_fields: Dict[str, SettingsField] = {}
-    already_merged_parent_for_field = set()
 
     def merge_field(attr_key, merge_field):
-        if attr_key not in setting_fields:
-            setting_fields[attr_key] = SettingsField(
-                name=attr_key, source_name=attr_key
-            )
+        setting_field = setting_fields.get(attr_key)
+        if setting_field is None:
+            setting_field = SettingsField(name=attr_key, source_name=attr_key)
+            setting_fields[attr_key] = setting_field
 
-        # If we have not merged parent field yet,
-        # then do so first before we merge anything else into new field.
-        #
-        # The objective is to only merge parents into fields that are defined/overriden
-        # on the child-class; we don't otherwise want the parent-field in the child-class.
-        #
-        # If they are not defined as new field on the child class, we should directly
-        # use the parent field when it's asked for on child and NOT generate a new child field
-        # for that parent field.
-        if attr_key not in already_merged_parent_for_field:
-            already_merged_parent_for_field.add(attr_key)
+            # When creating the field, merge parent field into it first,
+            # before we merge anything else into new field.
+            #
+            # The objective is to only merge parents into fields that are defined/overriden
+            # on the child-class; we don't otherwise want the parent-field in the child-class.
+            #
+            # If they are not defined as new field on the child class, we should directly
+            # use the parent field when it's asked for on child and NOT generate a new child
+            # field for that parent field.
             if p_field := parent_fields.get(attr_key):
-                setting_fields[attr_key].merge(p_field)
+                setting_field.merge(p_field)
 
-        setting_fields[attr_key].merge(merge_field)
+        setting_field.merge(merge_field)
 
     _add_field_default_from_attrs(fields, merge_field)
     _add_field_typehints_from_annotations(annotations, allowed_field_names, merge_field)
-    _unwrap_typehints(fields, merge_field)
     _add_field_overrides_from_attrs(fields, merge_field)
 
     for field in setting_fields.values():
@@ -470,6 +551,13 @@ def generate_setting_fields(
                 f""
             )
 
+        # Field names are used as dict keys and for lookups by retrievers, interning them
+        # lets those lookups compare them by identity.
+        if type(field.name) is str:
+            field.name = sys.intern(field.name)
+        if type(field.source_name) is str:
+            field.source_name = sys.intern(field.source_name)
+
         unwrapped_results = unwrap_union(field.type_hint)
         field.type_hint = unwrapped_results.unwrapped_type
 
@@ -480,6 +568,8 @@ def generate_setting_fields(
         if field.required is None:
             field.required = True
 
+        field._resolve_converter()
+
     return setting_fields
 
 
@@ -512,10 +602,14 @@ def _add_field_default_from_attrs(class_attrs: Dict[str, Any], merge_field):
             v: property
 
             # 'fget' on properties are the getter-function.
-            if callable(getattr(v, 'fget', None)):
+            # If getter has no return annotation at all, skip the (expensive) `get_type_hints`;
+            # it would resolve all the other annotations just to find no return type-hint.
+            fget = getattr(v, 'fget', None)
+            fget_annotations = getattr(fget, '__annotations__', None)
+            if callable(fget) and (fget_annotations is None or 'return' in fget_annotations):
                 # Extract type-hint from the getter-functions return annotation;
                 # We will use it as a default/fallback type-hint.
-                prop_getter_return_type = get_type_hints(v.fget).get('return', None)
+                prop_getter_return_type = get_type_hints(fget).get('return', None)
                 if prop_getter_return_type is not None:
                     field_values.type_hint = prop_getter_return_type
 
@@ -549,16 +643,6 @@ def _add_field_default_from_attrs(class_attrs: Dict[str, Any], merge_field):
         merge_field(k, field_values)
 
 
-def _unwrap_typehints(field_attrs: Dict[str, Any], merge_field):
-    """We take the public initial class attributes and their values and merge/create
-    fields from them.
-    """
-    for k, v in field_attrs.items():
-        field = v
-        if isinstance(v, SettingsField):
-            merge_field(k, field)
-
-
 def _add_field_overrides_from_attrs(field_attrs: Dict[str, Any], merge_field):
     """We take the public initial class attributes and their values and merge/create
     fields from them.
@@ -57,6 +57,7 @@ class SettingsRetrieverProtocol(Protocol):
     in python's `mro` (method-resolution-order), checking its own class first
     before checking any super-classes for default-retrievers.
     """
+    __slots__ = ()
 
     def __call__(self, *, field: SettingsField, settings: BaseSettings) -> Any:
         """
@@ -80,17 +81,22 @@ class SettingsRetrieverProtocol(Protocol):
 
 class EnvVarRetriever(SettingsRetrieverProtocol):
     """ Used to  """
+    __slots__ = ()
+
     def __call__(self, *, field: SettingsField, settings: 'BaseSettings') -> Any:
         environ = os.environ
+        name = field.name
 
         # First try to get field using the same case as the original field name:
-        value = environ.get(field.name, None)
+        value = environ.get(name, None)
         if value is not None:
             return value
 
         # If we did not get any value back (not even a blank-string),
         # attempt lookup by upper-casing the name
         # (as upper-case is extremely common for env-vars):
-        return environ.get(field.name.upper())
-
-
+        upper_name = name.upper()
+        if upper_name == name:
+            # Name is already upper-case, and we just looked that up above.
+            return None
+        return environ.get(upper_name)
@@ -5,8 +5,11 @@ See doc-comments for `BaseSettings` below.
 
 """
 
+from types import MappingProxyType
+from warnings import warn
 from typing import (
-    Dict, Any, Union, TypeVar, Protocol, Optional, Iterable, List, Type, TYPE_CHECKING
+    Mapping, Dict, Any, Union, TypeVar, Protocol, Optional, Iterable, List, Tuple, Type,
+    TYPE_CHECKING
 )
 
 from xinject import Dependency, XContext
@@ -25,6 +28,41 @@ T = TypeVar("T")
 RetrieverOrList = 'Union[SettingsRetrieverProtocol, Iterable[SettingsRetrieverProtocol]]'
 
 
+def _mro_for_bases(bases) -> 'Iterable[type]':
+    """
+    Returns the `__mro__` a new class with `bases` will have (without the new class its self),
+    so we can know it before the class is created.
+
+    With a single base-class (the common case) it's simply that base-class's `__mro__`,
+    otherwise we use the same C3 linearization python uses to merge the bases `__mro__`.
+    """
+    if len(bases) == 1:
+        return bases[0].__mro__
+
+    sequences = [list(b.__mro__) for b in bases] + [list(bases)]
+    mro = []
+    while True:
+        sequences = [s for s in sequences if s]
+        if not sequences:
+            return mro
+
+        # Find first head that is not in the tail of any other sequence.
+        for sequence in sequences:
+            head = sequence[0]
+            if not any(head in s[1:] for s in sequences):
+                break
+        else:
+            raise TypeError(
+                f"Cannot create a consistent method resolution order (MRO) for bases "
+                f"{', '.join(b.__name__ for b in bases)}"
+            )
+
+        mro.append(head)
+        for sequence in sequences:
+            if sequence[0] is head:
+                del sequence[0]
+
+
 class _SettingsMeta(type):
     """Represents the class-type instance/obj of the `BaseSettings` class.
     Any attributes in this object will be class-level attributes of
@@ -35,18 +73,34 @@ class _SettingsMeta(type):
     """
 
     # This will be a class-attributes on the normal `BaseSettings` class/subclasses.
-    _setting_fields: Dict[str, SettingsField]
+    # Both field mappings are read-only views, they are never modified after class creation.
+    _setting_fields: Mapping[str, SettingsField]
+
+    _all_setting_fields: Mapping[str, SettingsField]
+    """
+    All fields available on the class, including the ones inherited from any BaseSettings
+    superclasses (fields in a class closer to us in the `__mro__` take priority).
+
+    Computed once when class is created, so it can be reused when a subclass is created
+    instead of walking all the super-classes again.
+    """
     _default_retrievers: 'List[SettingsRetrieverProtocol]'
 
     _there_is_plain_superclass: bool
     """ There is some other superclass, other then BaseSettings/object/Dependency. """
 
-    _setting_subclasses_in_mro: 'List[Type[BaseSettings]]'
+    _setting_subclasses_in_mro: 'Tuple[Type[BaseSettings], ...]'
     """
     Includes self/cls plus all superclasses who are BaseSettings subclasses in __mro__
     (but not BaseSettings it's self); in the same order that they appears in __mro__.
     """
 
+    _class_property_cache: 'Dict[str, SettingsClassProperty]'
+    """
+    Forward-ref `SettingsClassProperty` objects `_SettingsMeta.__getattr__` has already made
+    for this specific class, by field name; they don't hold any state so can be reused.
+    """
+
     def __new__(
         mcls,
         name,
@@ -80,26 +134,27 @@ class _SettingsMeta(type):
         """
         # These defaults may be altered later on in this method (after class is created)...
         attrs['_there_is_plain_superclass'] = False
-        attrs['_setting_subclasses_in_mro'] = []
-        attrs['_default_retrievers'] = list(xloop(default_retrievers))
+        attrs['_setting_subclasses_in_mro'] = ()
+        attrs['_class_property_cache'] = {}
+        attrs['_default_retrievers'] = (
+            [] if default_retrievers is None else list(xloop(default_retrievers))
+        )
 
         if skip_field_generation:
             # Skip doing anything special with any BaseSettings classes created in our/this module;
             # They are abstract classes and are need to be sub-classed to do anything with them.
-            attrs['_setting_fields'] = {}
+            attrs['_setting_fields'] = attrs['_all_setting_fields'] = MappingProxyType({})
             cls = super().__new__(mcls, name, bases, attrs, **kwargs)  # noqa
             return cls
 
-        # W need to get base-types in mro order, before we create the class.
-        types_in_mro = type(name, bases, {}, skip_field_generation=True).__mro__[1:]
+        # We need to get base-types in mro order, before we create the class.
+        types_in_mro = _mro_for_bases(bases)
 
         # And look through the __mro__ python determined while creating the class,
         # we cache the specific ones/information we need this one time so future operators
         # are simpler/faster.
+        # We can't include 'us' yet because our type has not been created yet.
         setting_subclasses_in_mro = []
-
-        # We install can't include 'us' because our type has not been created yet.
-        attrs['_setting_subclasses_in_mro'] = setting_subclasses_in_mro
         for c in types_in_mro:
             # Skip the ones that are always present, and don't need to examined...
             if c is BaseSettings:
@@ -112,32 +167,47 @@ class _SettingsMeta(type):
             # We want to know the order if aby BaseSettings subclasses that we are inheriting from.
             # Also want to know if there are any plain/non-setting classes in our parent hierarchy
             # (that are not object/Dependency, as they both will always be present).
-            if issubclass(c, BaseSettings):
+            # All BaseSettings subclasses are created by us, cheaper to check that.
+            if isinstance(c, _SettingsMeta):
                 setting_subclasses_in_mro.append(c)
             else:
                 attrs['_there_is_plain_superclass'] = True
 
         parent_fields = {}
 
-        for c in reversed(setting_subclasses_in_mro):
-            parent_fields.update(c._setting_fields)
+        if (
+            setting_subclasses_in_mro and
+            setting_subclasses_in_mro[0]._setting_subclasses_in_mro ==
+            tuple(setting_subclasses_in_mro)
+        ):
+            # Common case, our BaseSettings superclasses are the same as our first BaseSettings
+            # superclass (plus that superclass its self); we can reuse its already merged fields.
+            parent_fields.update(setting_subclasses_in_mro[0]._all_setting_fields)
+        else:
+            for c in reversed(setting_subclasses_in_mro):
+                parent_fields.update(c._setting_fields)
 
         setting_fields = generate_setting_fields(
             attrs, parent_fields
         )
 
-        attrs["_setting_fields"] = setting_fields
+        attrs["_setting_fields"] = MappingProxyType(setting_fields)
+        attrs["_all_setting_fields"] = MappingProxyType({**parent_fields, **setting_fields})
 
         # Any attributes that were converted to fields we remove from class attributes,
         # they instead will be dynamically looked up lazily as-needed via their associated field.
         for k in setting_fields.keys():
             attrs.pop(k, None)
 
+        # Until class is created, only has our BaseSettings superclasses.
+        attrs['_setting_subclasses_in_mro'] = tuple(setting_subclasses_in_mro)
+
         # This creates the new BaseSettings class/subclass.
         cls = super().__new__(mcls, name, bases, attrs, **kwargs)
 
-        # Insert newly crated class into top of its setting subclasses list.
-        cls._setting_subclasses_in_mro.insert(0, cls)
+        # Newly created class goes at the top of its setting subclasses; it's never modified after
+        # this, so we use a tuple.
+        cls._setting_subclasses_in_mro = (cls, *setting_subclasses_in_mro)
 
         # We now link source_class of each field to us; helps with debugging.
         for field in setting_fields.values():
@@ -218,7 +288,7 @@ class _SettingsMeta(type):
 
         # Anything that starts with `_` or starts with `settings__`
         # is handled like a normal pythonattribute.
-        if key.startswith("_") or key.startswith("settings__"):
+        if key[:1] == "_" or key.startswith("settings__"):
             raise AttributeError(
                 f"An attribute lookup that start with `_` or `settings__` just happened ({key}) "
                 f"and it does not exist. "
@@ -227,21 +297,16 @@ class _SettingsMeta(type):
                 f"attribute name ({key}) on BaseSettings subclass ({self})."
             )
 
-        for c in self._setting_subclasses_in_mro:
-            c: _SettingsMeta
-            if key in c._setting_fields:
-                break
-            # We got to `BaseSettings` without finding anything, BaseSettings has no fields,
-            # raise exception about how we could not find field.
-            if c is BaseSettings:
-                raise AttributeError(
-                    f"Have no class-attribute or defined SettingsField for "
-                    f"attribute name ({key}) on BaseSettings subclass ({self})."
-                )
+        lazy_retriever = self._class_property_cache.get(key)
+        if lazy_retriever is None:
+            @SettingsClassProperty
+            def lazy_retriever(calling_cls):
+                return getattr(self.grab(), key)
 
-        @SettingsClassProperty
-        def lazy_retriever(calling_cls):
-            return getattr(self.grab(), key)
+            # Only remember the ones for our fields, so looking up arbitrary attribute names
+            # (ie: via `hasattr`) won't keep adding to the cache.
+            if key in self._all_setting_fields:
+                self._class_property_cache[key] = lazy_retriever
 
         return lazy_retriever
 
@@ -253,20 +318,11 @@ class _SettingsMeta(type):
         We may do something more with this in the future, for now leaving other
         use-cases unsupported (such as creating new setting fields on already created subclasses).
         """
-        if key.startswith("_"):
+        if key[:1] == "_":
             return super().__setattr__(key, value)
 
-        field = None
-        for c in self._setting_subclasses_in_mro:
-            c: _SettingsMeta
-            if field := c._setting_fields.get(key):
-                break
-            # We got to `BaseSettings` without finding anything, BaseSettings has no fields,
-            # give-up searching for field.
-            if c is BaseSettings:
-                break
-
-        if not field:
+        field = self._all_setting_fields.get(key)
+        if field is None:
             # Right now we don't support making new SettingField's after the BaseSettings subclass
             # has been created. We could decide to do that in the future, but for now we
             # are keeping things simpler.
@@ -284,6 +340,10 @@ class BaseSettings(
     metaclass=_SettingsMeta,
     default_retrievers=[],
 
+    # Values remembered for `SettingsField.cache` fields belong only to the instance
+    # that retrieved them.
+    attributes_to_skip_while_copying=['_resolved_cache'],
+
     # BaseSettings has no fields, it's a special abstract-type of class skip field generation.
     # You should never use this option in a BaseSettings subclass.
     skip_field_generation=True
@@ -414,7 +474,8 @@ class BaseSettings(
             see `BaseSettings.settings__instance_retrievers`.
 
         """
-        self._instance_retrievers = list(xloop(retrievers))
+        # Normally no retrievers are passed in, no need to loop over anything for that case.
+        self._instance_retrievers = [] if retrievers is None else list(xloop(retrievers))
 
         for k, v in kwargs.items():
             setattr(self, k, v)
@@ -422,15 +483,39 @@ class BaseSettings(
     def add_instance_retrievers(
             self, retrievers: 'Union[List[SettingsRetrieverProtocol], SettingsRetrieverProtocol]'
     ):
-        from warnings import warn
         warn(
             f"BaseSettings.add_instance_retrievers is now deprecated, "
             f"was used on subclass ({type(self)}); "
             f"use property `settings__instance_retrievers` and call 'append' on result; "
-            f"ie: `my_settings.settings__instance_retrievers.append(retriever)"
+            f"ie: `my_settings.settings__instance_retrievers.append(retriever)",
+            stacklevel=2
         )
         self.settings__instance_retrievers.extend(xloop(retrievers))
 
+    def settings__forget_cached_values(self, *field_names: str):
+        """
+        Forgets values remembered for fields that use `xsettings.fields.SettingsField.cache`,
+        the next time one of them is asked for its value will be retrieved again.
+
+        Remembered values are otherwise kept for the life of this settings instance;
+        they are not forgotten when a field's default value is changed on the class, or when
+        a value set directly on the instance is deleted.
+
+        Args:
+            *field_names: Names of the fields to forget the values for;
+                if none are given, forget the remembered values for all fields.
+        """
+        resolved_cache = self.__dict__.get('_resolved_cache')
+        if not resolved_cache:
+            return
+
+        if not field_names:
+            resolved_cache.clear()
+            return
+
+        for name in field_names:
+            resolved_cache.pop(name, None)
+
     @property
     def settings__instance_retrievers(self) -> 'List[SettingsRetrieverProtocol]':
         """
@@ -484,42 +569,30 @@ class BaseSettings(
     def __getattribute__(self, key):
         # Anything that starts with `_` or starts with `settings__`
         # is handled like a normal python attribute.
-        if key.startswith("_") or key.startswith("settings__"):
+        if key[:1] == "_" or key.startswith("settings__"):
             return object.__getattribute__(self, key)
 
         attr_error = None
         value = None
         already_retrieved_normal_value = False
         cls = type(self)
-        field: Optional[SettingsField] = None
-
-        for c in cls._setting_subclasses_in_mro:
-            c: _SettingsMeta
-            # todo: use isinstance?
-            if c is BaseSettings:
-                # We got to the 'BaseSettings' base-class it's self, no need to go any further.
-                break
-            if field := c._setting_fields.get(key):
-                # Found the field, break out of loop.
-                break
-
-        def get_normal_value(obj: BaseSettings = self):
-            nonlocal value
-            nonlocal attr_error
-
-            # Keep track that we already attempted to get normal value.
-            nonlocal already_retrieved_normal_value
-            if obj is self:
-                already_retrieved_normal_value = True
-
-            try:
-                # Look for an attribute on self first.
-                value = object.__getattribute__(obj, key)
-                if hasattr(value, "__get__"):
-                    value = value.__get__(obj, cls)
-                attr_error = None
-            except AttributeError as error:
-                attr_error = error
+        field: Optional[SettingsField] = cls._all_setting_fields.get(key)
+
+        # Going though `self.__dict__` would call back into us, so grab it directly one time.
+        self_dict = object.__getattribute__(self, '__dict__')
+
+        if field is not None:
+            # Fast-path: If the value was directly set on self, it's what we use;
+            # no need to look at plain superclasses, the dependency-chain or the retrievers.
+            # (forward-refs set on self can resolve to `None`, so leave them to the normal path)
+            value = self_dict.get(key)
+            if (
+                value is not None and
+                value is not Default and
+                getattr(type(value), '__get__', None) is None
+            ):
+                return _resolve_field_value(settings=self, field=field, key=key, value=value)
+            value = None
 
         # We don't want to grab the value like normal if we are a field
         # and DON'T have a locally/instance value defined for attribute.
@@ -529,20 +602,33 @@ class BaseSettings(
         #
         # Otherwise, the plain-class attribute would ALWAYS be used over the field,
         # making the subclasses field definition somewhat useless.
-        if not self._there_is_plain_superclass or not field or key in self.__dict__:
-            get_normal_value()
-
+        # (read from our class, `self._there_is_plain_superclass` would call back into us)
+        if not cls._there_is_plain_superclass or field is None or key in self_dict:
+            value, attr_error = _get_normal_value(self, key, cls)
+            already_retrieved_normal_value = True
+
+        # Parent-setting-instances (not super/base classes), only looked up once as it's
+        # needed here and when resolving the field value via the retrievers.
+        dependency_chain = None
         if not already_retrieved_normal_value or value is None:
+            dependency_chain = tuple(XContext.grab().dependency_chain(cls))
+
             # See if any parent-setting-instances (not super/base classes)
-            for parent_settings in XContext.grab().dependency_chain(cls):
-                if key in parent_settings.__dict__:
-                    get_normal_value(parent_settings)
+            for parent_settings in dependency_chain:
+                if key in object.__getattribute__(parent_settings, '__dict__'):
+                    value, attr_error = _get_normal_value(parent_settings, key, cls)
 
                 if value is not None:
                     break
         try:
-            if field:
-                return _resolve_field_value(settings=self, field=field, key=key, value=value)
+            if field is not None:
+                return _resolve_field_value(
+                    settings=self,
+                    field=field,
+                    key=key,
+                    value=value,
+                    dependency_chain=dependency_chain
+                )
         except SettingsValueError as e:
             # todo: Do some sort of refactoring/splitting this out of this method
             #       (starting to get too large).
@@ -555,7 +641,7 @@ class BaseSettings(
                 # Just continue the original exception
                 raise
 
-            get_normal_value()
+            value, attr_error = _get_normal_value(self, key, cls)
             if attr_error:
                 # Could not get the normal value from superclass, raise original exception.
                 # todo: for Python 3.11, we can raise both exceptions (e + attr_error)
@@ -606,28 +692,78 @@ Here for backwards compatability, renamed original class from `Settings` to `Bas
 """
 
 
-def _resolve_field_value(settings: BaseSettings, field: SettingsField, key: str, value: Any):
+def _get_normal_value(
+        obj: BaseSettings, key: str, cls: _SettingsMeta
+) -> Tuple[Any, Optional[AttributeError]]:
+    """
+    Gets attribute `key` from `obj` like python normally would (ie: ignoring settings-fields).
+
+    Returns: Tuple of the value (`None` if we could not get one) and the `AttributeError`
+        we got while trying to get the value (`None` if there was no error).
+    """
+    # Fields normally have no instance or class attribute, so probe for one
+    # before asking python; it's much cheaper than raising/catching AttributeError.
+    if key not in object.__getattribute__(obj, '__dict__'):
+        for klass in type(obj).__mro__:
+            if key in klass.__dict__:
+                break
+        else:
+            return None, AttributeError(f"'{type(obj).__name__}' object has no attribute '{key}'")
+
+    try:
+        # Look for an attribute on obj first.
+        value = object.__getattribute__(obj, key)
+        # Like python, look for `__get__` on the type (not the value), which is cheaper.
+        value_get = getattr(type(value), '__get__', None)
+        if value_get is not None:
+            value = value_get(value, obj, cls)
+    except AttributeError as error:
+        return None, error
+    return value, None
+
+
+def _resolve_field_value(
+        settings: BaseSettings,
+        field: SettingsField,
+        key: str,
+        value: Any,
+        dependency_chain: Optional[Iterable[BaseSettings]] = None
+):
     cls = type(settings)
 
+    # For `SettingsField.cache` fields, use the value we remembered last time we retrieved it.
+    resolved_cache = None
+    if field.cache and (value is None or value is Default):
+        settings_dict = object.__getattribute__(settings, '__dict__')
+        resolved_cache = settings_dict.get('_resolved_cache')
+        if resolved_cache is None:
+            resolved_cache = settings_dict['_resolved_cache'] = {}
+        elif key in resolved_cache:
+            return resolved_cache[key]
+
     # If we have a field, and current value is Default, or we got AttributeError,
     # we attempt to retrieve the value via the field's retriever.
     if value is None or value is Default:
-        def self_and_parent_retrievers():
-            for r in settings._instance_retrievers:
-                yield r
-
-            for parent_settings in XContext.grab().dependency_chain(cls):
-                # skip self if we are in chain, already did it.
-                if parent_settings is settings:
-                    continue
-                for r in parent_settings._instance_retrievers:
-                    yield r
-
-            for parent_class in cls._setting_subclasses_in_mro:
-                for r in parent_class._default_retrievers:
-                    yield r
-
-        for retriever in xloop(field.retriever, self_and_parent_retrievers()):
+        # Retrievers in the order we try them: field's retriever, self + parent instance
+        # retrievers and then the default-retrievers of each class in mro.
+        field_retriever = field.retriever
+        retrievers = [field_retriever] if field_retriever is not None else []
+        # (`settings._instance_retrievers` would go though `BaseSettings.__getattribute__`)
+        retrievers.extend(object.__getattribute__(settings, '_instance_retrievers'))
+
+        if dependency_chain is None:
+            dependency_chain = XContext.grab().dependency_chain(cls)
+
+        for parent_settings in dependency_chain:
+            # skip self if we are in chain, already did it.
+            if parent_settings is settings:
+                continue
+            retrievers.extend(object.__getattribute__(parent_settings, '_instance_retrievers'))
+
+        for parent_class in cls._setting_subclasses_in_mro:
+            retrievers.extend(parent_class._default_retrievers)
+
+        for retriever in retrievers:
             value = retriever(field=field, settings=settings)
 
             if value is Default:
@@ -650,18 +786,23 @@ def _resolve_field_value(settings: BaseSettings, field: SettingsField, key: str,
         value = None
 
     # If value is a property, get the value from the property...
-    if value and hasattr(value, '__get__'):
-        value = value.__get__(settings, cls)
-
-    original_value = value
-    value = field.convert_value(value)
+    if value and (value_get := getattr(type(value), '__get__', None)) is not None:
+        value = value_get(value, settings, cls)
+
+    # Most of the time value is already the type we want, no need to convert it.
+    if type(value) is not field.type_hint:
+        original_value = value
+        value = field.convert_value(value)
+
+        if value is None and field.required:
+            raise SettingsValueError(
+                f'Field ({field}) is required/non-optional and the value we have is '
+                f'`None` after running the converter on the originally retrieved value of '
+                f'({original_value}).'
+            )
 
-    if value is None and field.required:
-        raise SettingsValueError(
-            f'Field ({field}) is required/non-optional and the value we have is '
-            f'`None` after running the converter on the originally retrieved value of '
-            f'({original_value}).'
-        )
+    if resolved_cache is not None:
+        resolved_cache[key] = value
     return value
 
 